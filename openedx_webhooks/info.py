@@ -5,7 +5,8 @@ import csv
 import fnmatch
 import logging
 import re
-from typing import Dict, Iterable, Optional
+from types import MappingProxyType
+from typing import Dict, Iterable, Mapping, Optional
 
 import yaml
 from glom import glom
@@ -22,6 +23,17 @@ from openedx_webhooks.utils import (
 
 logger = logging.getLogger(__name__)
 
+# Use the much faster LibYAML loader if PyYAML was built with it.
+try:
+    from yaml import CSafeLoader as YamlSafeLoader
+except ImportError:
+    from yaml import SafeLoader as YamlSafeLoader   # type: ignore[assignment]
+
+
+def _yaml_load(text: str):
+    """Safely load YAML text."""
+    return yaml.load(text, Loader=YamlSafeLoader)
+
 
 def _github_file_url(repo_fullname: str, file_path: str) -> str:
     """Get the GitHub url to retrieve the text of a file."""
@@ -31,7 +43,7 @@ def _github_file_url(repo_fullname: str, file_path: str) -> str:
 
 def _read_yaml_data_file(filename):
     """Read a YAML file from openedx-webhooks-data."""
-    return yaml.safe_load(_read_data_file(filename))
+    return _yaml_load(_read_data_file(filename))
 
 def _read_csv_data_file(filename):
     """
@@ -134,8 +146,12 @@ def get_people_file():
     return people
 
 
+@memoize_timed(minutes=15)
 def get_orgs_file():
-    orgs = _read_yaml_data_file("orgs.yaml")
+    """
+    Get the orgs data, keyed by both the org key and the org's "name".
+    """
+    orgs = dict(_read_yaml_data_file("orgs.yaml"))
     for org_data in list(orgs.values()):
         if "name" in org_data:
             orgs[org_data["name"]] = org_data
@@ -143,14 +159,17 @@ def get_orgs_file():
 
 
 @memoize_timed(minutes=30)
-def get_jira_info() -> dict[str, JiraServer]:
+def get_jira_info() -> Mapping[str, JiraServer]:
     """
-    Get the dict mapping Jira nicknames to JiraServer objects.
+    Get the mapping of Jira nicknames to JiraServer objects.
+
+    The result is shared by all callers until the cache expires, so it is
+    read-only.
     """
     jira_info = {}
     for key, info in _read_yaml_data_file(settings.JIRA_INFO_FILE).items():
         jira_info[key.lower()] = JiraServer(**info)
-    return jira_info
+    return MappingProxyType(jira_info)
 
 
 class NoJiraServer(Exception):
@@ -224,11 +243,13 @@ def is_bot_pull_request(pull_request: PrDict) -> bool:
     return pull_request["user"]["type"] == "Bot"
 
 
+WIP_RE = re.compile(r"\b(WIP|wip)\b")
+
 def is_draft_pull_request(pull_request: PrDict) -> bool:
     """
     Is this a draft (or WIP) pull request?
     """
-    return pull_request.get("draft", False) or bool(re.search(r"\b(WIP|wip)\b", pull_request["title"]))
+    return pull_request.get("draft", False) or bool(WIP_RE.search(pull_request["title"]))
 
 
 def _pr_author_data(pull_request: PrDict) -> Optional[Dict]:
@@ -264,6 +285,8 @@ def pull_request_has_cla(pull_request: PrDict) -> bool:
     return agreement != "none"
 
 
+BLENDED_PROJECT_RE = re.compile(r"\[\s*BD\s*-\s*(\d+)\s*\]")
+
 def get_blended_project_id(pull_request: PrDict) -> Optional[int]:
     """
     Find the blended project id in the pull request, if any.
@@ -271,7 +294,7 @@ def get_blended_project_id(pull_request: PrDict) -> Optional[int]:
     Returns:
         An int ("[BD-5]" returns 5, for example) found in the pull request, or None.
     """
-    m = re.search(r"\[\s*BD\s*-\s*(\d+)\s*\]", pull_request["title"])
+    m = BLENDED_PROJECT_RE.search(pull_request["title"])
     if m:
         return int(m[1])
     else:
@@ -304,7 +327,7 @@ def get_bot_comments(prid: PrId) -> Iterable[PrCommentDict]:
 def get_catalog_info(repo_fullname: str) -> Dict:
     """Get the parsed catalog-info.yaml data from a repo, or {} if missing."""
     yml = read_github_file(repo_fullname, "catalog-info.yaml", not_there="{}")
-    return yaml.safe_load(yml)
+    return _yaml_load(yml)
 
 
 def projects_for_pr(pull_request: PrDict) -> Iterable[GhProject]:
@@ -358,7 +381,7 @@ def jira_details_for_pr(jira_nick: str, pr: PrDict) -> tuple[str, str]:
     """
 
     jira_info = get_jira_server_info(jira_nick)
-    mapping = yaml.safe_load(_read_github_url(jira_info.mapping))
+    mapping = _yaml_load(_read_github_url(jira_info.mapping))
     repo_name = pr["base"]["repo"]["full_name"]
     details = mapping.get("defaults", {})
     for repo_info in mapping.get("repos", []):
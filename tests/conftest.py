@@ -1,10 +1,13 @@
 """Automatically run by pytest to set up test infrastructure."""
 
+import contextlib
 import re
 from pathlib import Path
 from typing import Dict
+from unittest import mock
 
 import pytest
+import requests
 import requests_mock
 
 import openedx_webhooks
@@ -26,27 +29,66 @@ def requests_mocker():
     finally:
         mocker.stop()
 
+@pytest.fixture(scope="session")
+def http():
+    """
+    A requests.Session for tests to make their own requests with.
+
+    requests_mock patches the Session transport, so mocks installed for each
+    test still apply to this shared session.
+    """
+    with requests.Session() as session:
+        yield session
+
 # URLs we use to grab data from GitHub.  We use requests_mock to provide
 # canned data during tests.
 DATA_REGEX = re.compile(r"https://raw.githubusercontent.com/([^/]+/[^/]+)/HEAD/(.*)")
 
+def _repo_data_callback(request, context):
+    """Read repo_data data from local data."""
+    m = re.fullmatch(DATA_REGEX, request.url)
+    assert m, f"{request.url = }"
+    repo_data_dir = Path(__file__).parent / "repo_data"
+    file_path = repo_data_dir / "/".join(m.groups())
+    if file_path.exists():
+        return file_path.read_text()
+    else:
+        context.status_code = 404
+        return "No such file"
+
 @pytest.fixture
 def fake_repo_data(requests_mocker):
     """A fixture to use local files instead of GitHub-fetched data files."""
+    requests_mocker.get(DATA_REGEX, text=_repo_data_callback)
 
-    def _repo_data_callback(request, context):
-        """Read repo_data data from local data."""
-        m = re.fullmatch(DATA_REGEX, request.url)
-        assert m, f"{request.url = }"
-        repo_data_dir = Path(__file__).parent / "repo_data"
-        file_path = repo_data_dir / "/".join(m.groups())
-        if file_path.exists():
-            return file_path.read_text()
-        else:
-            context.status_code = 404
-            return "No such file"
 
-    requests_mocker.get(DATA_REGEX, text=_repo_data_callback)
+@contextlib.contextmanager
+def _session_repo_data():
+    """
+    Provide the repo data files and the test settings outside of any one test.
+
+    For session-scoped fixtures, which can't use `fake_repo_data` or
+    `settings_for_tests`.
+    """
+    test_values = {name: value for name, value in vars(test_settings).items() if name.isupper()}
+    with requests_mock.Mocker(real_http=False, case_sensitive=True) as mocker:
+        with mock.patch.multiple(openedx_webhooks.settings, **test_values):
+            mocker.get(DATA_REGEX, text=_repo_data_callback)
+            yield
+
+
+@pytest.fixture(scope="session")
+def people_file():
+    """The result of get_people_file() for our test data, read once per session."""
+    with _session_repo_data():
+        return openedx_webhooks.info.get_people_file()
+
+
+@pytest.fixture(scope="session")
+def jira_info():
+    """The result of get_jira_info() for our test data, read once per session."""
+    with _session_repo_data():
+        return openedx_webhooks.info.get_jira_info()
 
 
 @pytest.fixture(scope="session", autouse=True)
@@ -66,6 +108,24 @@ def hard_cache_yaml_data_files(session_mocker) -> None:
     session_mocker.patch("openedx_webhooks.info._read_yaml_data_file", new_read_yaml_data_file)
 
 
+@pytest.fixture(scope="session", autouse=True)
+def hard_cache_data_file_text(session_mocker) -> None:
+    """
+    Data files are fetched through mocked HTTP, and the memoized copies are
+    cleared for every test.  Fetch the text of each one once per test run,
+    and re-use it.
+    """
+    real_read_data_file = openedx_webhooks.info._read_data_file
+    file_texts: Dict[str, str] = {}
+    def new_read_data_file(filename):
+        text = file_texts.get(filename)
+        if text is None:
+            text = real_read_data_file(filename)
+            file_texts[filename] = text
+        return text
+    session_mocker.patch("openedx_webhooks.info._read_data_file", new_read_data_file)
+
+
 def pytest_addoption(parser):
     parser.addoption(
         "--percent-404",
@@ -75,29 +135,57 @@ def pytest_addoption(parser):
     )
 
 
+def is_pure_test(request) -> bool:
+    """Is this test marked as not needing the app, settings, and caches set up?"""
+    return request.node.get_closest_marker("pure") is not None
+
+
 @pytest.fixture(autouse=True)
-def settings_for_tests(mocker):
+def settings_for_tests(request, mocker):
+    """Use the test settings.  Tests marked as pure don't need them, and skip this."""
+    if is_pure_test(request):
+        return
     for name, value in vars(test_settings).items():
         if name.isupper():
             mocker.patch(f"openedx_webhooks.settings.{name}", value)
 
-@pytest.fixture
-def fake_github(pytestconfig, mocker, requests_mocker, fake_repo_data):
+@pytest.fixture(scope="session")
+def session_fake_github(pytestconfig):
+    """
+    A FakeGitHub made once for the whole test run.
+
+    Use `fake_github` in tests, it resets this for each test.
+    """
     fraction_404 = float(pytestconfig.getoption("percent_404")) / 100.0
-    the_fake_github = FakeGitHub(login="webhook-bot", fraction_404=fraction_404)
+    return FakeGitHub(login="webhook-bot", fraction_404=fraction_404)
+
+
+@pytest.fixture
+def fake_github(session_fake_github, mocker, requests_mocker, fake_repo_data):
+    the_fake_github = session_fake_github
+    the_fake_github.reset_state()
     the_fake_github.install_mocks(requests_mocker)
-    if fraction_404:
+    if the_fake_github.fraction_404:
         # Make the retry sleep a no-op so it won't slow the tests.
         mocker.patch("openedx_webhooks.utils.retry_sleep", lambda x: None)
     return the_fake_github
 
 
+@pytest.fixture(scope="session")
+def session_fake_jiras():
+    """FakeJira objects keyed by url, made once and re-used by the fake_jira fixtures."""
+    return {}
+
+
 def fake_jira_fixture(url):
     """A function to make fake Jira fixtures!"""
     @pytest.fixture
-    def _fake_jira(requests_mocker, fake_repo_data):
+    def _fake_jira(session_fake_jiras, requests_mocker, fake_repo_data):
         """A FakeJira for the first server configured in our jira-info.yaml."""
-        the_fake_jira = FakeJira(url)
+        the_fake_jira = session_fake_jiras.get(url)
+        if the_fake_jira is None:
+            the_fake_jira = session_fake_jiras[url] = FakeJira(url)
+        the_fake_jira.reset_state()
         the_fake_jira.install_mocks(requests_mocker)
         return the_fake_jira
     return _fake_jira
@@ -107,20 +195,36 @@ fake_jira2 = fake_jira_fixture("https://test2.atlassian.net")
 fake_jira_another = fake_jira_fixture("https://anotherorg.atlassian.net")
 
 
+@pytest.fixture(scope="session")
+def flask_app():
+    """
+    The Flask app, created once for the whole test session.
+
+    Each test gets its own request context in `configure_flask_app`, so no
+    request or `g` state is shared between tests.
+    """
+    return openedx_webhooks.create_app(config="testing")
+
+
 @pytest.fixture(autouse=True)
-def configure_flask_app():
+def configure_flask_app(request):
     """
     Needed to make the app understand it's running under HTTPS, and have Flask
     initialized properly.
     """
-    app = openedx_webhooks.create_app(config="testing")
+    if is_pure_test(request):
+        yield
+        return
+    app = request.getfixturevalue("flask_app")
     with app.test_request_context('/', base_url="https://openedx-webhooks.herokuapp.com"):
         yield
 
 
 @pytest.fixture(autouse=True)
-def reset_all_memoized_functions():
+def reset_all_memoized_functions(request):
     """Clears the values cached by @memoize before each test. Applied automatically."""
+    if is_pure_test(request):
+        return
     openedx_webhooks.utils.clear_memoized_values()
 
 
@@ -5,7 +5,6 @@ A fake implementation of the GitHub REST and GraphQL API.
 from __future__ import annotations
 
 import collections
-import dataclasses
 import datetime
 import itertools
 import random
@@ -52,16 +51,17 @@ class User:
         }
 
 
-@dataclass
+@dataclass(frozen=True)
 class Label:
     name: str
     color: Optional[str] = "ededed"
     description: Optional[str] = None
 
     def as_json(self):
-        return dataclasses.asdict(self)
+        return {"name": self.name, "color": self.color, "description": self.description}
 
-DEFAULT_LABELS = [
+# Labels are immutable, so every repo can share these Label objects.
+DEFAULT_LABELS = {kwargs["name"]: Label(**kwargs) for kwargs in [
     {"name": "bug", "color": "d73a4a", "description": "Something isn't working"},
     {"name": "documentation", "color": "0075ca", "description": "Improvements or additions to documentation"},
     {"name": "duplicate", "color": "cfd3d7", "description": "This issue or pull request already exists"},
@@ -71,16 +71,14 @@ DEFAULT_LABELS = [
     {"name": "invalid", "color": "e4e669", "description": "This doesn't seem right"},
     {"name": "question", "color": "d876e3", "description": "Further information is requested"},
     {"name": "wontfix", "color": "ffffff", "description": "This will not be worked on"},
-]
-
-comment_ids = itertools.count(start=1001, step=137)
+]}
 
 @dataclass
 class Comment:
     """
     A comment on an issue or pull request.
     """
-    id: int = field(init=False, default_factory=comment_ids.__next__)
+    id: int
     user: User
     body: str
 
@@ -179,9 +177,8 @@ class PullRequest:
         Set the labels on this pull request.
         """
         labels = set(labels)
-        for label in labels:
-            if not self.repo.has_label(label):
-                self.repo.add_label(name=label)
+        for label in labels - self.repo.labels.keys():
+            self.repo.add_label(name=label)
         self.labels = labels
 
     def status(self, context):
@@ -241,7 +238,7 @@ class Repo:
 
     def make_comment(self, user, **kwargs) -> Comment:
         user = self.github.get_user(user, create=True)
-        comment = Comment(user, **kwargs)
+        comment = Comment(next(self.github.comment_ids), user, **kwargs)
         self.comments[comment.id] = comment
         return comment
 
@@ -251,14 +248,6 @@ class Repo:
         except KeyError:
             raise DoesNotExist(f"Label {self.full_name} {name!r} does not exist")
 
-    def has_label(self, name: str) -> bool:
-        return name in self.labels
-
-    def _set_labels(self, data: List[Dict]) -> None:
-        self.labels = {}
-        for kwargs in data:
-            self.add_label(**kwargs)
-
     def add_label(self, **kwargs) -> Label:
         label = Label(**kwargs)
         self.labels[label.name] = label
@@ -277,6 +266,8 @@ class Flaky404:
         """
         For GET requests, maybe return a 404 the first time it's requested.
         """
+        if not self.fraction_404:
+            return None
         if request.method != "GET":
             return None
         if request.path in self.paths:
@@ -292,10 +283,26 @@ class FakeGitHub(faker.Faker):
 
     def __init__(self, login, fraction_404=0) -> None:
         super().__init__(host="https://api.github.com")
-        if fraction_404:
-            self.add_middleware(Flaky404(fraction_404).middleware)
-
         self.login = login
+        self.comment_ids = itertools.count(start=1001, step=137)
+        self.flaky404 = Flaky404(fraction_404)
+        self.add_middleware(self.flaky404.middleware)
+        self.reset_state()
+
+    @property
+    def fraction_404(self) -> float:
+        """The fraction of first-time GET requests that will 404."""
+        return self.flaky404.fraction_404
+
+    @fraction_404.setter
+    def fraction_404(self, value: float) -> None:
+        self.flaky404.fraction_404 = value
+
+    def reset_state(self) -> None:
+        """
+        Forget everything, so this FakeGitHub can be re-used for another test.
+        """
+        self.flaky404.paths.clear()
         self.users: Dict[str, User] = {}
         self.repos: Dict[str, Repo] = {}
 
@@ -326,7 +333,7 @@ class FakeGitHub(faker.Faker):
 
     def make_repo(self, owner: str, repo: str, private: bool=False) -> Repo:
         r = Repo(self, owner, repo, private)
-        r._set_labels(DEFAULT_LABELS)
+        r.labels = dict(DEFAULT_LABELS)
         self.repos[f"{owner}/{repo}"] = r
         return r
 
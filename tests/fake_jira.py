@@ -9,6 +9,8 @@ from typing import Dict, Optional, Set
 from . import faker
 
 
+# Shared by all FakeJira servers, so an issue key is never valid on more
+# than one of them.
 issue_ids = itertools.count(start=101, step=13)
 
 def _make_issue_key(project: str) -> str:
@@ -80,6 +82,12 @@ class FakeJira(faker.Faker):
 
     def __init__(self, host) -> None:
         super().__init__(host=host)
+        self.reset_state()
+
+    def reset_state(self) -> None:
+        """
+        Forget all issues, so this FakeJira can be re-used for another test.
+        """
         # Map from issue keys to Issue objects.
         self.issues: Dict[str, Issue] = {}
         # Map from old keys to new keys for moved issues.
@@ -99,14 +107,14 @@ class FakeJira(faker.Faker):
 
         Returns None if the issue doesn't exist.
         """
-        while key in self.moves:
-            key = self.moves[key]
+        while (moved_key := self.moves.get(key)) is not None:
+            key = moved_key
         return self.issues.get(key)
 
     def move_issue(self, issue: Issue, project: str) -> Issue:
         """Move an issue to a new project."""
-        the_issue = self.find_issue(issue.key)
-        assert self.issues[issue.key] is the_issue
+        the_issue = self.issues.get(issue.key)
+        assert the_issue is issue
         new_key = _make_issue_key(project)
         self.moves[issue.key] = new_key
         del self.issues[issue.key]
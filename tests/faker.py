@@ -3,11 +3,17 @@ Base classes for defining fake implementations of APIs.
 
 """
 
-import functools
+import collections
 import inspect
 import json
 import re
-from typing import Any
+
+import requests_mock
+
+
+# One compact encoder for all responses.  json.dumps() would make a new
+# encoder on every call when given non-default arguments.
+_json_encoder = json.JSONEncoder(separators=(",", ":"))
 
 
 class FakerException(Exception):
@@ -46,20 +52,8 @@ def route(path_regex, http_method="GET", data_type="json"):
 
     """
     def _decorator(func):
-        func.callback_spec = (path_regex, http_method.upper(), data_type)
-        @functools.wraps(func)
-        def _decorated(self, request, context) -> Any:
-            for fn in self.middleware:
-                result = fn(request, context)
-                if context.status_code != 200 or result is not None:
-                    return result
-            match = re.match(path_regex, request.path)
-            try:
-                return func(self, match, request, context)
-            except FakerException as ex:
-                context.status_code = ex.status_code
-                return ex.as_json()
-        return _decorated
+        func.callback_spec = (re.compile(path_regex), http_method.upper(), data_type)
+        return func
     return _decorator
 
 
@@ -77,6 +71,7 @@ class Faker:
         self.host = host
         self.requests_mocker = None
         self.middleware = []
+        self._routes: dict[str, tuple] | None = None
 
     def add_middleware(self, middleware_func):
         """
@@ -92,16 +87,63 @@ class Faker:
     def install_mocks(self, requests_mocker) -> None:
         """
         Install mock requests for all of this Faker's handlers.
+
+        Only one matcher is registered for the host. It dispatches to the
+        right handler itself, so requests_mock has fewer matchers to try on
+        each request.  The route tables are collected the first time this is
+        called, and re-used after that.
         """
         self.requests_mocker = requests_mocker
-        for _, method in inspect.getmembers(self, inspect.ismethod):
-            if hasattr(method, "callback_spec"):
-                path_regex, http_method, data_type = method.callback_spec
-                self.requests_mocker.register_uri(
-                    http_method,
-                    re.compile(fr"^{self.host}{path_regex}(\?.*)?$"),
-                    **{data_type: method},
-                )
+        if self._routes is None:
+            self._routes = self._collect_routes()
+        self.requests_mocker.register_uri(
+            requests_mock.ANY,
+            re.compile(fr"^{re.escape(self.host)}/"),
+            text=self._dispatch,
+        )
+
+    def _collect_routes(self) -> dict[str, tuple]:
+        """
+        Find the route handlers on this class.
+
+        Returns a dict mapping HTTP methods to tuples of
+        (compiled_path_regex, data_type, bound_handler).
+        """
+        routes = collections.defaultdict(list)
+        for name, func in inspect.getmembers(type(self), inspect.isfunction):
+            if hasattr(func, "callback_spec"):
+                path_re, http_method, data_type = func.callback_spec
+                routes[http_method].append((path_re, data_type, getattr(self, name)))
+        return {http_method: tuple(route_table) for http_method, route_table in routes.items()}
+
+    def _dispatch(self, request, context) -> str:
+        """
+        Find the handler for a request, and produce the text of the response.
+        """
+        assert self._routes is not None
+        for path_re, data_type, handler in self._routes.get(request.method, ()):
+            if match := path_re.fullmatch(request.path):
+                break
+        else:
+            raise requests_mock.NoMockAddress(request)
+
+        result = None
+        for fn in self.middleware:
+            result = fn(request, context)
+            if context.status_code != 200 or result is not None:
+                break
+        else:
+            try:
+                result = handler(match, request, context)
+            except FakerException as ex:
+                context.status_code = ex.status_code
+                result = ex.as_json()
+
+        if result is None:
+            return ""
+        if data_type == "json":
+            return _json_encoder.encode(result)
+        return result
 
     def requests_made(
         self,
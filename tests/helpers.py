@@ -7,6 +7,13 @@ from openedx_webhooks.info import get_jira_server_info
 from openedx_webhooks.types import JiraId
 
 
+# Regexes for check_good_markdown.
+COMMENT_IN_MIDDLE_RE = re.compile(".<!--")
+COMMENT_WITH_FOLLOWING_RE = re.compile("-->.")
+LINK_TO_NONE_RE = re.compile(r"\[None\]\(")
+LINK_TO_NONE_URL_RE = re.compile(r"\]\([^)]*/None[/)]")
+
+
 def check_good_markdown(text: str) -> None:
     """
     Make some checks of Markdown text.
@@ -22,17 +29,17 @@ def check_good_markdown(text: str) -> None:
 
     # HTML comments must be on a line by themselves or the Markdown won't
     # render properly.
-    if re.search(".<!--", text):
+    if COMMENT_IN_MIDDLE_RE.search(text):
         raise ValueError(f"Markdown shouldn't have an HTML comment in the middle of a line: {text!r}")
-    if re.search("-->.", text):
+    if COMMENT_WITH_FOLLOWING_RE.search(text):
         raise ValueError(f"Markdown shouldn't have an HTML comment with following text: {text!r}")
 
     # We should never link to something called "None".
-    if re.search(r"\[None\]\(", text):
+    if LINK_TO_NONE_RE.search(text):
         raise ValueError(f"Markdown has a link to None: {text!r}")
 
     # We should never link to a url with None as a component.
-    if re.search(r"\]\([^)]*/None[/)]", text):
+    if LINK_TO_NONE_URL_RE.search(text):
         raise ValueError(f"Markdown has a link to a None url: {text!r}")
 
 
@@ -56,17 +63,22 @@ def check_issue_link_in_markdown(text: str, jira_id: JiraId|None) -> None:
         assert "/browse/" not in text, "Markdown links to JIRA when we have no issue id"
 
 
-def random_text() -> str:
+def random_text(rng=random) -> str:
     """
     Generate a random text string.
+
+    `rng` can be a random.Random instance to use instead of the `random` module.
     """
     alphabet = "abcdefghijklmnopqrstuvwxyz"
     words = []
-    for _ in range(random.randint(4, 10)):
-        words.append("".join(random.choice(alphabet) for _ in range(random.randrange(1, 6))))
+    for _ in range(rng.randint(4, 10)):
+        words.append("".join(rng.choice(alphabet) for _ in range(rng.randrange(1, 6))))
     return " ".join(words)
 
 
+GRAPHQL_COMMENT_RE = re.compile(r"(?m)#.*$")
+
+
 def check_good_graphql(text: str) -> None:
     """
     Do some simple checks of a GraphQL query.
@@ -76,7 +88,7 @@ def check_good_graphql(text: str) -> None:
         is wrong.
     """
     # Remove all comments.
-    code = re.sub(r"(?m)#.*$", "", text)
+    code = GRAPHQL_COMMENT_RE.sub("", text)
 
     # The first word should be "query" or "mutation".
     first = code.split(None, 1)[0]
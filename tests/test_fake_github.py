@@ -1,25 +1,19 @@
 """Tests of FakeGithub."""
 
 import pytest
-import requests
 
 from freezegun import freeze_time
-from glom import glom
 
-from .fake_github import FakeGitHub
-
-
-# pylint: disable=missing-timeout
 
 class TestUsers:
-    def test_get_me(self, fake_github):
-        resp = requests.get("https://api.github.com/user")
+    def test_get_me(self, fake_github, http):
+        resp = http.get("https://api.github.com/user")
         assert resp.status_code == 200
         assert resp.json() == {"login": "webhook-bot"}
 
-    def test_get_user(self, fake_github):
+    def test_get_user(self, fake_github, http):
         fake_github.make_user(login="nedbat", name="Ned Batchelder")
-        resp = requests.get("https://api.github.com/users/nedbat")
+        resp = http.get("https://api.github.com/users/nedbat")
         assert resp.status_code == 200
         uj = resp.json()
         assert uj["login"] == "nedbat"
@@ -37,19 +31,42 @@ class TestRepos:
         assert repo == repo2
 
 
+@pytest.fixture
+def repo(fake_github):
+    """The an-org/a-repo repo that most of these tests use."""
+    return fake_github.make_repo("an-org", "a-repo")
+
+
+@pytest.fixture
+def pr(repo):
+    """A pull request in an-org/a-repo."""
+    return repo.make_pull_request(
+        user="some-user",
+        title="Here is a pull request",
+        body="It's a good pull request, you should merge it.",
+    )
+
+
+@pytest.fixture
+def frozen_time():
+    """Freeze time for the whole test.  Use `.move_to()` to change the time."""
+    with freeze_time("2021-08-31 15:30:12") as frozen:
+        yield frozen
+
+
+@pytest.fixture
+def frozen_pr(frozen_time, pr):     # pylint: disable=unused-argument
+    """Like `pr`, but created at a known time."""
+    # frozen_time is listed first so that time is frozen before `pr` is made.
+    return pr
+
+
 class TestPullRequests:
-    def test_make_pull_request(self, fake_github):
-        repo = fake_github.make_repo("an-org", "a-repo")
-        with freeze_time("2021-08-31 15:30:12"):
-            pr = repo.make_pull_request(
-                user="some-user",
-                title="Here is a pull request",
-                body="It's a good pull request, you should merge it.",
-            )
-        resp = requests.get(f"https://api.github.com/repos/an-org/a-repo/pulls/{pr.number}")
+    def test_make_pull_request(self, frozen_pr, http):
+        resp = http.get(f"https://api.github.com/repos/an-org/a-repo/pulls/{frozen_pr.number}")
         assert resp.status_code == 200
         prj = resp.json()
-        assert prj["number"] == pr.number
+        assert prj["number"] == frozen_pr.number
         assert prj["user"]["login"] == "some-user"
         assert prj["user"]["name"] == "Some User"
         assert prj["user"]["url"] == "https://api.github.com/users/some-user"
@@ -59,39 +76,32 @@ class TestPullRequests:
         assert prj["state"] == "open"
         assert prj["labels"] == []
         assert prj["base"]["repo"]["full_name"] == "an-org/a-repo"
-        assert prj["html_url"] == f"https://github.com/an-org/a-repo/pull/{pr.number}"
+        assert prj["html_url"] == f"https://github.com/an-org/a-repo/pull/{frozen_pr.number}"
         assert prj["created_at"] == "2021-08-31T15:30:12Z"
         assert prj["closed_at"] is None
 
-    def test_no_such_pull_request(self, fake_github):
-        fake_github.make_repo("an-org", "a-repo")
-        resp = requests.get("https://api.github.com/repos/an-org/a-repo/pulls/99")
+    @pytest.mark.usefixtures("repo")
+    def test_no_such_pull_request(self, http):
+        resp = http.get("https://api.github.com/repos/an-org/a-repo/pulls/99")
         assert resp.status_code == 404
         assert resp.json()["message"] == "Pull request an-org/a-repo #99 does not exist"
 
-    def test_no_such_repo_for_pull_request(self, fake_github):
-        fake_github.make_repo("an-org", "a-repo")
-        resp = requests.get("https://api.github.com/repos/some-user/another-repo/pulls/1")
+    @pytest.mark.usefixtures("repo")
+    def test_no_such_repo_for_pull_request(self, http):
+        resp = http.get("https://api.github.com/repos/some-user/another-repo/pulls/1")
         assert resp.status_code == 404
         assert resp.json()["message"] == "Repo some-user/another-repo does not exist"
 
-    def test_close_pull_request(self, fake_github, is_merged):
-        repo = fake_github.make_repo("an-org", "a-repo")
-        with freeze_time("2021-08-31 15:30:12"):
-            pr = repo.make_pull_request(
-                user="some-user",
-                title="Here is a pull request",
-                body="It's a good pull request, you should merge it.",
-            )
-        resp = requests.get(f"https://api.github.com/repos/an-org/a-repo/pulls/{pr.number}")
+    def test_close_pull_request(self, frozen_pr, frozen_time, is_merged, http):
+        resp = http.get(f"https://api.github.com/repos/an-org/a-repo/pulls/{frozen_pr.number}")
         assert resp.status_code == 200
         prj = resp.json()
         assert prj["created_at"] == "2021-08-31T15:30:12Z"
         assert prj["closed_at"] is None
 
-        with freeze_time("2021-09-01 01:02:03"):
-            pr.close(merge=is_merged)
-        resp = requests.get(f"https://api.github.com/repos/an-org/a-repo/pulls/{pr.number}")
+        frozen_time.move_to("2021-09-01 01:02:03")
+        frozen_pr.close(merge=is_merged)
+        resp = http.get(f"https://api.github.com/repos/an-org/a-repo/pulls/{frozen_pr.number}")
         prj = resp.json()
         assert prj["created_at"] == "2021-08-31T15:30:12Z"
         assert prj["closed_at"] == "2021-09-01T01:02:03Z"
@@ -99,8 +109,7 @@ class TestPullRequests:
 
 
 @pytest.fixture
-def pull_requests_to_list(fake_github):
-    repo = fake_github.make_repo("an-org", "a-repo")
+def pull_requests_to_list(repo):
     repo.make_pull_request(user="user1", title="Title 1", body="Boo")
     repo.make_pull_request(user="user2", title="Title 2", body="Boo", state="closed")
     repo.make_pull_request(user="user1", title="Title 3", body="Boo hoo")
@@ -109,8 +118,8 @@ def pull_requests_to_list(fake_github):
 
 
 class TestPullRequestList:
-    def test_list_pull_requests(self, pull_requests_to_list):
-        resp = requests.get("https://api.github.com/repos/an-org/a-repo/pulls")
+    def test_list_pull_requests(self, pull_requests_to_list, http):
+        resp = http.get("https://api.github.com/repos/an-org/a-repo/pulls")
         prjs = resp.json()
         # By default, only open pull requests are listed.
         assert len(prjs) == 3
@@ -122,8 +131,8 @@ class TestPullRequestList:
         ("closed", 2, True),
         ("all", 5, False),
     ])
-    def test_list_pull_requests_count(self, pull_requests_to_list, state, number, specific):
-        resp = requests.get(f"https://api.github.com/repos/an-org/a-repo/pulls?state={state}")
+    def test_list_pull_requests_count(self, pull_requests_to_list, state, number, specific, http):
+        resp = http.get(f"https://api.github.com/repos/an-org/a-repo/pulls?state={state}")
         prjs = resp.json()
         assert len(prjs) == number
         if specific:
@@ -131,15 +140,10 @@ class TestPullRequestList:
 
 
 class TestPullRequestLabels:
-    def test_updating_labels_with_api(self, fake_github):
-        repo = fake_github.make_repo("an-org", "a-repo")
-        pr = repo.make_pull_request(
-            title="Here is a pull request",
-            body="It's a good pull request, you should merge it.",
-        )
+    def test_updating_labels_with_api(self, repo, pr, http):
         assert pr.labels == set()
 
-        resp = requests.patch(
+        resp = http.patch(
             f"https://api.github.com/repos/an-org/a-repo/issues/{pr.number}",
             json={"labels": ["new label", "bug", "another label"]},
         )
@@ -149,7 +153,7 @@ class TestPullRequestLabels:
         assert repo.get_label("bug").color == "d73a4a"
         assert repo.get_label("another label").color == "ededed"
 
-        resp = requests.get(
+        resp = http.get(
             f"https://api.github.com/repos/an-org/a-repo/pulls/{pr.number}"
         )
         assert resp.status_code == 200
@@ -162,12 +166,7 @@ class TestPullRequestLabels:
             ("new label", "ededed"),
         ]
 
-    def test_updating_labels_elsewhere(self, fake_github):
-        repo = fake_github.make_repo("an-org", "a-repo")
-        pr = repo.make_pull_request(
-            title="Here is a pull request",
-            body="It's a good pull request, you should merge it.",
-        )
+    def test_updating_labels_elsewhere(self, repo, pr, http):
         assert pr.labels == set()
 
         pr.set_labels(["new label", "bug", "another label"])
@@ -177,7 +176,7 @@ class TestPullRequestLabels:
         assert repo.get_label("bug").color == "d73a4a"
         assert repo.get_label("another label").color == "ededed"
 
-        resp = requests.get(
+        resp = http.get(
             f"https://api.github.com/repos/an-org/a-repo/pulls/{pr.number}"
         )
         assert resp.status_code == 200
@@ -192,11 +191,9 @@ class TestPullRequestLabels:
 
 
 class TestComments:
-    def test_listing_comments(self, fake_github):
-        repo = fake_github.make_repo("an-org", "a-repo")
-        pr = repo.make_pull_request()
+    def test_listing_comments(self, pr, http):
         assert pr.comments == []
-        resp = requests.get(
+        resp = http.get(
             f"https://api.github.com/repos/an-org/a-repo/issues/{pr.number}/comments"
         )
         assert resp.status_code == 200
@@ -204,21 +201,18 @@ class TestComments:
 
         pr.add_comment(user="tusbar", body="This is my comment")
         pr.add_comment(user="feanil", body="I love this change!")
-        resp = requests.get(
+        resp = http.get(
             f"https://api.github.com/repos/an-org/a-repo/issues/{pr.number}/comments"
         )
         assert resp.status_code == 200
-        summary = glom(resp.json(), [{"u": "user.login", "b": "body"}])
+        summary = [{"u": c["user"]["login"], "b": c["body"]} for c in resp.json()]
         assert summary == [
             {"u": "tusbar", "b": "This is my comment"},
             {"u": "feanil", "b": "I love this change!"},
         ]
 
-    def test_posting_comments(self, fake_github):
-        repo = fake_github.make_repo("an-org", "a-repo")
-        pr = repo.make_pull_request()
-
-        resp = requests.post(
+    def test_posting_comments(self, pr, http):
+        resp = http.post(
             f"https://api.github.com/repos/an-org/a-repo/issues/{pr.number}/comments",
             json={"body": "I'm making a comment"},
         )
@@ -228,100 +222,90 @@ class TestComments:
         assert the_comment.user.login == "webhook-bot"
         assert the_comment.body == "I'm making a comment"
 
-    def test_editing_comments(self, fake_github):
-        repo = fake_github.make_repo("an-org", "a-repo")
-        pr = repo.make_pull_request()
-
+    def test_editing_comments(self, pr, http):
         pr.add_comment(user="tusbar", body="This is my comment")
         pr.add_comment(user="feanil", body="I love this change!")
 
         # List the comments, and get the id of the first one.
-        resp = requests.get(f"https://api.github.com/repos/an-org/a-repo/issues/{pr.number}/comments")
+        resp = http.get(f"https://api.github.com/repos/an-org/a-repo/issues/{pr.number}/comments")
         comment_id = resp.json()[0]["id"]
 
         # Update the first comment.
-        resp = requests.patch(
+        resp = http.patch(
             f"https://api.github.com/repos/an-org/a-repo/issues/comments/{comment_id}",
             json={"body": "I've changed my mind about my comment."},
         )
         assert resp.status_code == 200
 
         # List the comments, and see the body of the first comment has changed.
-        resp = requests.get(f"https://api.github.com/repos/an-org/a-repo/issues/{pr.number}/comments")
+        resp = http.get(f"https://api.github.com/repos/an-org/a-repo/issues/{pr.number}/comments")
         assert resp.json()[0]["body"] == "I've changed my mind about my comment."
 
-    def test_posting_bad_comments(self, fake_github):
-        repo = fake_github.make_repo("an-org", "a-repo")
-        pr = repo.make_pull_request()
-
+    def test_posting_bad_comments(self, pr, http):
         with pytest.raises(ValueError, match="Markdown has a link to None"):
-            requests.post(
+            http.post(
                 f"https://api.github.com/repos/an-org/a-repo/issues/{pr.number}/comments",
                 json={"body": "Look: [None](https://foo.com)"},
             )
 
-    def test_editing_bad_comments(self, fake_github):
-        repo = fake_github.make_repo("an-org", "a-repo")
-        pr = repo.make_pull_request()
-
+    def test_editing_bad_comments(self, pr, http):
         pr.add_comment(user="tusbar", body="This is my comment")
         pr.add_comment(user="feanil", body="I love this change!")
 
         # List the comments, and get the id of the first one.
-        resp = requests.get(f"https://api.github.com/repos/an-org/a-repo/issues/{pr.number}/comments")
+        resp = http.get(f"https://api.github.com/repos/an-org/a-repo/issues/{pr.number}/comments")
         comment_id = resp.json()[0]["id"]
 
         # Update the first comment.
         with pytest.raises(ValueError, match="Markdown has a link to None"):
-            requests.patch(
+            http.patch(
                 f"https://api.github.com/repos/an-org/a-repo/issues/comments/{comment_id}",
                 json={"body": "Look: [None](https://foo.com)"},
             )
 
-    def test_deleting_comments(self, fake_github):
-        repo = fake_github.make_repo("an-org", "a-repo")
-        pr = repo.make_pull_request()
-
+    def test_deleting_comments(self, pr, http):
         pr.add_comment(user="tusbar", body="This is my comment")
         pr.add_comment(user="feanil", body="I love this change!")
 
         # List the comments, and get the id of the first one.
-        resp = requests.get(f"https://api.github.com/repos/an-org/a-repo/issues/{pr.number}/comments")
+        resp = http.get(f"https://api.github.com/repos/an-org/a-repo/issues/{pr.number}/comments")
         comment_id = resp.json()[0]["id"]
 
         # Update the first comment.
-        resp = requests.delete(
+        resp = http.delete(
             f"https://api.github.com/repos/an-org/a-repo/issues/comments/{comment_id}",
         )
         assert resp.status_code == 204
 
         # List the comments, and see only the second comment.
-        resp = requests.get(f"https://api.github.com/repos/an-org/a-repo/issues/{pr.number}/comments")
+        resp = http.get(f"https://api.github.com/repos/an-org/a-repo/issues/{pr.number}/comments")
         comments = resp.json()
         assert len(comments) == 1
         assert comments[0]["body"] == "I love this change!"
 
 
 @pytest.fixture
-def flaky_github(requests_mocker, fake_repo_data):
-    the_fake_github = FakeGitHub(login="webhook-bot", fraction_404=1)
-    the_fake_github.install_mocks(requests_mocker)
-    return the_fake_github
+def flaky_github(fake_github):
+    """The usual fake_github, but every first GET of a URL will 404."""
+    old_fraction_404 = fake_github.fraction_404
+    fake_github.fraction_404 = 1
+    yield fake_github
+    fake_github.fraction_404 = old_fraction_404
 
 class TestFlakyGitHub:
-    def test_get(self, flaky_github):
+    def test_get(self, flaky_github, http):
         # The first time we request something, it's 404, and then it's OK after that.
-        resp = requests.get("https://api.github.com/user")
+        resp = http.get("https://api.github.com/user")
         assert resp.status_code == 404
-        resp = requests.get("https://api.github.com/user")
+        resp = http.get("https://api.github.com/user")
         assert resp.status_code == 200
-        resp = requests.get("https://api.github.com/user")
+        resp = http.get("https://api.github.com/user")
         assert resp.status_code == 200
 
-    def test_post(self, flaky_github):
+    def test_post(self, flaky_github, http):
         repo = flaky_github.make_repo("an-org", "a-repo")
         pr = repo.make_pull_request()
-        resp = requests.post(
+        resp = http.post(
             f"https://api.github.com/repos/an-org/a-repo/issues/{pr.number}/comments",
             json={"body": "I'm making a comment"},
         )
@@ -3,14 +3,11 @@ Test the Faker class and its helpers.
 """
 
 import pytest
-import requests
 import requests_mock
 
 from . import faker
 
 
-# pylint: disable=missing-timeout
-
 class MyException(faker.FakerException):
     status_code = 501
 
@@ -71,29 +68,29 @@ def my_fake():
         mocker.stop()
 
 
-def test_json_data(my_fake):
-    resp = requests.get("https://myapi.com/api/something/ME-123")
+def test_json_data(my_fake, http):
+    resp = http.get("https://myapi.com/api/something/ME-123")
     assert resp.status_code == 200
     assert resp.json() == {"hello": "there", "id": "ME-123"}
 
-def test_post(my_fake):
-    resp = requests.post("https://myapi.com/api/something/ME-456")
+def test_post(my_fake, http):
+    resp = http.post("https://myapi.com/api/something/ME-456")
     assert resp.status_code == 200
     assert resp.json() == {"created": "ME-456"}
 
-def test_exception(my_fake):
-    resp = requests.get("https://myapi.com/api/bad")
+def test_exception(my_fake, http):
+    resp = http.get("https://myapi.com/api/bad")
     assert resp.status_code == 501
     assert resp.json() == {"error": "Bad!"}
 
-def test_query_and_status(my_fake):
-    resp = requests.get("https://myapi.com/api/status?code=477")
+def test_query_and_status(my_fake, http):
+    resp = http.get("https://myapi.com/api/status?code=477")
     assert resp.status_code == 477
     assert resp.text == ""
 
-def test_middleware(my_fake):
+def test_middleware(my_fake, http):
     """Middleware can interrupt handler execution."""
-    resp = requests.get("https://myapi.com/api/status?code=477&foo")
+    resp = http.get("https://myapi.com/api/status?code=477&foo")
     assert resp.status_code == 789
 
 
@@ -104,16 +101,16 @@ def test_middleware(my_fake):
     ("GET", "http://myapi.com/api/something/ME-123"),
     ("GET", "https://otherapi.com/api/something/ME-123"),
 ])
-def test_no_address(my_fake, method, url):
+def test_no_address(my_fake, method, url, http):
     with pytest.raises(requests_mock.NoMockAddress):
-        requests.request(method, url)
-
-def test_requests_made(my_fake):
-    requests.get("https://myapi.com/api/something/1")
-    requests.get("https://myapi.com/api/something/1234")
-    requests.post("https://myapi.com/api/something/labels")
-    requests.delete("https://myapi.com/api/something/bug123")
-    requests.get("https://some.other.host/")
+        http.request(method, url)
+
+def test_requests_made(my_fake, http):
+    http.get("https://myapi.com/api/something/1")
+    http.get("https://myapi.com/api/something/1234")
+    http.post("https://myapi.com/api/something/labels")
+    http.delete("https://myapi.com/api/something/bug123")
+    http.get("https://some.other.host/")
     assert my_fake.requests_made() == [
         ("/api/something/1", "GET"),
         ("/api/something/1234", "GET"),
@@ -132,29 +129,29 @@ def test_requests_made(my_fake):
         ("/api/something/1234", "GET"),
     ]
 
-def test_reset_mock(my_fake):
-    requests.get("https://myapi.com/api/something/1")
-    requests.get("https://myapi.com/api/something/1234")
+def test_reset_mock(my_fake, http):
+    http.get("https://myapi.com/api/something/1")
+    http.get("https://myapi.com/api/something/1234")
     my_fake.reset_mock()
-    requests.post("https://myapi.com/api/something/labels")
-    requests.delete("https://myapi.com/api/something/bug123")
-    requests.get("https://some.other.host/")
+    http.post("https://myapi.com/api/something/labels")
+    http.delete("https://myapi.com/api/something/bug123")
+    http.get("https://some.other.host/")
     assert my_fake.requests_made() == [
         ("/api/something/labels", "POST"),
         ("/api/something/bug123", "DELETE"),
     ]
 
-def test_readonly(my_fake):
-    requests.get("https://myapi.com/api/something/1")
-    requests.get("https://myapi.com/api/something/1234")
-    requests.get("https://some.other.host/")
+def test_readonly(my_fake, http):
+    http.get("https://myapi.com/api/something/1")
+    http.get("https://myapi.com/api/something/1234")
+    http.get("https://some.other.host/")
     my_fake.assert_readonly()
 
-def test_not_readonly(my_fake):
-    requests.get("https://myapi.com/api/something/1")
-    requests.get("https://myapi.com/api/something/1234")
-    requests.post("https://myapi.com/api/something/labels")
-    requests.delete("https://myapi.com/api/something/bug123")
-    requests.get("https://some.other.host/")
+def test_not_readonly(my_fake, http):
+    http.get("https://myapi.com/api/something/1")
+    http.get("https://myapi.com/api/something/1234")
+    http.post("https://myapi.com/api/something/labels")
+    http.delete("https://myapi.com/api/something/bug123")
+    http.get("https://some.other.host/")
     with pytest.raises(AssertionError):
         my_fake.assert_readonly()
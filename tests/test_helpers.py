@@ -1,11 +1,16 @@
 """Tests of the helpers in tests/helpers.py"""
 
+import random
+
 import pytest
 
 from .helpers import check_good_graphql, check_good_markdown, random_text
 
+# These tests only exercise plain functions.
+pytestmark = pytest.mark.pure
+
 
-@pytest.mark.parametrize("text, ok, msg", [
+MARKDOWN_CASES = [
     ("This is a paragraph", True, ""),
     ("This is a paragraph\n\nThis is also\n", True, ""),
     ("   Bad: initial space", False, "start with whitespace"),
@@ -15,23 +20,9 @@ from .helpers import check_good_graphql, check_good_markdown, random_text
     ("Look here: [None](https://foo.com).", False, "link to None"),
     ("Look here: [foo](https://foo.com/api/id/None).", False, "link to a None"),
     ("Look here: [foo](https://foo.com/api/id/None/comments).", False, "link to a None"),
-])
-def test_check_good_markdown(text, ok, msg):
-    if ok:
-        assert msg == ""
-        check_good_markdown(text)
-    else:
-        with pytest.raises(ValueError, match=msg):
-            check_good_markdown(text)
-
+]
 
-def test_random_text():
-    texts = set(random_text() for _ in range(10))
-    assert len(texts) == 10
-    assert "" not in texts
-
-
-@pytest.mark.parametrize("text, ok, msg", [
+GRAPHQL_CASES = [
     ("query { org }", True, ""),
     ("# This is GraphQL!\n query Hello {org}\n", True, ""),
     (" what { org }", False, "wrong word"),
@@ -62,11 +53,27 @@ def test_random_text():
           }
         }
         """, False, "balanced"),
+]
+
+
+@pytest.mark.parametrize("checker, text, ok, msg", [
+    *[(check_good_markdown, *case) for case in MARKDOWN_CASES],
+    *[(check_good_graphql, *case) for case in GRAPHQL_CASES],
 ])
-def test_check_good_graphql(text, ok, msg):
+def test_checker(checker, text, ok, msg):
     if ok:
         assert msg == ""
-        check_good_graphql(text)
+        checker(text)
     else:
         with pytest.raises(ValueError, match=msg):
-            check_good_graphql(text)
+            checker(text)
+
+
+def test_random_text():
+    rng = random.Random(0xDEADBEEF)
+    seen = set()
+    for _ in range(10):
+        text = random_text(rng)
+        assert text, "random_text() returned an empty string"
+        assert text not in seen, f"random_text() repeated {text!r}"
+        seen.add(text)
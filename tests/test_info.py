@@ -6,8 +6,6 @@ import pytest
 
 from openedx_webhooks.info import (
     get_blended_project_id,
-    get_jira_info,
-    get_people_file,
     is_draft_pull_request,
     is_internal_pull_request,
     jira_details_for_pr,
@@ -15,10 +13,9 @@ from openedx_webhooks.info import (
 
 
 # These tests should run when we want to test flaky GitHub behavior.
-pytestmark = [
-    pytest.mark.flaky_github,
-    pytest.mark.usefixtures("fake_repo_data"),
-]
+# Tests that read repo data get it through the fake_github fixture, which
+# uses fake_repo_data.
+pytestmark = pytest.mark.flaky_github
 
 
 @pytest.fixture
@@ -27,51 +24,25 @@ def make_pull_request(fake_github):
     Provide a function for making a JSON pull request object.
     """
     def _fn(user, repo="openedx/edx-platform", **kwargs):
-        fake_github.make_user(user)
         owner, repo = repo.split("/")
         pr = fake_github.make_pull_request(user=user, owner=owner, repo=repo, **kwargs)
         return pr.as_json()
     return _fn
 
 
-def test_edx_employee(make_pull_request):
-    pr = make_pull_request("nedbat")
-    assert is_internal_pull_request(pr)
-    pr = make_pull_request("nedbat", repo="edx/something")
-    assert is_internal_pull_request(pr)
-
-def test_tcril_employee(make_pull_request):
-    pr = make_pull_request("feanil")
-    assert is_internal_pull_request(pr)
-    pr = make_pull_request("feanil", repo="edx/something")
-    assert not is_internal_pull_request(pr)
-
-def test_ex_edx_employee(make_pull_request):
-    pr = make_pull_request("mmprandom")
-    assert not is_internal_pull_request(pr)
-
-def test_never_heard_of_you(make_pull_request):
-    pr = make_pull_request("some_random_guy")
-    assert not is_internal_pull_request(pr)
-
-def test_hourly_worker(make_pull_request):
-    pr = make_pull_request("theJohnnyBrown")
-    assert not is_internal_pull_request(pr)
-
-def test_left_but_still_a_fan(make_pull_request):
-    pr = make_pull_request("jarv")
-    assert not is_internal_pull_request(pr)
-
-def test_current_person_no_institution():
-    people = get_people_file()
-    current_person = people["jarv"]
-    assert "institution" not in current_person
-    assert current_person["agreement"] == "individual"
-
-def test_current_person():
-    people = get_people_file()
-    current_person = people["raisingarizona"]
-    assert current_person["agreement"] == "none"
+@pytest.mark.parametrize("user, repo, internal", [
+    pytest.param("nedbat", "openedx/edx-platform", True, id="edx_employee"),
+    pytest.param("nedbat", "edx/something", True, id="edx_employee_edx_repo"),
+    pytest.param("feanil", "openedx/edx-platform", True, id="tcril_employee"),
+    pytest.param("feanil", "edx/something", False, id="tcril_employee_edx_repo"),
+    pytest.param("mmprandom", "openedx/edx-platform", False, id="ex_edx_employee"),
+    pytest.param("some_random_guy", "openedx/edx-platform", False, id="never_heard_of_you"),
+    pytest.param("theJohnnyBrown", "openedx/edx-platform", False, id="hourly_worker"),
+    pytest.param("jarv", "openedx/edx-platform", False, id="left_but_still_a_fan"),
+])
+def test_is_internal_pull_request(make_pull_request, user, repo, internal):
+    pr = make_pull_request(user, repo=repo)
+    assert is_internal_pull_request(pr) == internal
 
 @pytest.mark.parametrize("title, number", [
     ("Please take my change", None),
@@ -82,62 +53,72 @@ def test_current_person():
     ("[BD-34] [BB-1234] extra tags are OK", 34),
     ("[BB-1234] [BD-34] extra tags are OK", 34),
 ])
-def test_get_blended_project_id(fake_github, title, number):
-    pr = fake_github.make_pull_request(title=title)
-    num = get_blended_project_id(pr.as_json())
+def test_get_blended_project_id(title, number):
+    # Only the title matters, so a whole fake pull request isn't needed.
+    num = get_blended_project_id({"title": title})
     assert number == num
 
 
-TITLES_WIP = [
-    ("My awesome pull request", False),
-    ("WIP: not ready yet", True),
-    ("[WIP] hare-brained idea", True),
-    ("Still working it out (WIP)", True),
-    ("(wip) working on it", True),
-    ("Swipe left if you like it", False),
-    ("This is wip, not ready yet", True),
-]
+TITLES_WIP = (
+    pytest.param("My awesome pull request", False, id="plain"),
+    pytest.param("WIP: not ready yet", True, id="wip_prefix"),
+    pytest.param("[WIP] hare-brained idea", True, id="wip_brackets"),
+    pytest.param("Still working it out (WIP)", True, id="wip_suffix"),
+    pytest.param("(wip) working on it", True, id="wip_lowercase"),
+    pytest.param("Swipe left if you like it", False, id="swipe_not_wip"),
+    pytest.param("This is wip, not ready yet", True, id="wip_in_middle"),
+)
 
 @pytest.mark.parametrize("title, is_wip", TITLES_WIP)
-def test_is_wip_pull_request(fake_github, title, is_wip):
+def test_is_wip_pull_request(title, is_wip):
     # A PR is draft if it has a WIP title.
-    pr = fake_github.make_pull_request(title=title)
-    assert is_draft_pull_request(pr.as_json()) == is_wip
+    assert is_draft_pull_request({"title": title, "draft": False}) == is_wip
 
-@pytest.mark.parametrize("title", [p[0] for p in TITLES_WIP])
-def test_is_draft_pull_request(fake_github, title):
+@pytest.mark.parametrize("title, _is_wip", TITLES_WIP)
+def test_is_draft_pull_request(title, _is_wip):
     # No matter what the title, a pr is Draft if it says it is.
-    pr = fake_github.make_pull_request(title=title, draft=True)
-    assert is_draft_pull_request(pr.as_json())
-
-def test_check_csv_users_only():
-    people = get_people_file()
-    user = 'Carlos-Muniz'
-    # This user exists in the yaml but not in the csv, and should not be in people
-    assert people.get(user) is None
-
-def test_check_csv_org_priority():
-    people = get_people_file()
-    user = 'mmprandom'
-    assert people[user]['agreement'] == 'individual'
+    assert is_draft_pull_request({"title": title, "draft": True})
 
-def test_check_people_missing_yaml_fields():
-    people = get_people_file()
-    user = 'test-test'
-    assert people[user].get('jira') is None
-    assert people[user].get('commiter') is None
-    assert people[user].get('comments') is None
-    assert people[user].get('before') is None
+# Marks a field that must not be in the person's data at all.
+ABSENT = object()
 
-
-def test_jira_info():
-    info = get_jira_info()
+@pytest.mark.parametrize("user, expected", [
+    pytest.param("jarv", {"agreement": "individual", "institution": ABSENT}, id="no_institution"),
+    pytest.param("raisingarizona", {"agreement": "none"}, id="no_agreement"),
+    # This user exists in the yaml but not in the csv, and should not be in people
+    pytest.param("Carlos-Muniz", None, id="csv_users_only"),
+    pytest.param("mmprandom", {"agreement": "individual"}, id="csv_org_priority"),
+    pytest.param(
+        "test-test",
+        {"jira": ABSENT, "commiter": ABSENT, "comments": ABSENT, "before": ABSENT},
+        id="missing_yaml_fields",
+    ),
+])
+def test_people_file(people_file, user, expected):
+    # `expected` is None if the user shouldn't be in the people file, or a dict
+    # of fields to check, with ABSENT meaning the field shouldn't be there.
+    person = people_file.get(user)
+    if expected is None:
+        assert person is None
+        return
+    assert person is not None
+    for field, value in expected.items():
+        if value is ABSENT:
+            assert field not in person
+        else:
+            assert person[field] == value
+
+
+def test_jira_info(jira_info):
     # These are specific items from our test jira-info.yaml file
-    assert info["test1"].server == "https://test.atlassian.net"
+    assert jira_info["test1"].server == "https://test.atlassian.net"
     assert (
-        info["anotherorg"].mapping ==
+        jira_info["anotherorg"].mapping ==
         "https://raw.githubusercontent.com/anotherorg/dot-github/HEAD/jira-mapping.yaml"
     )
+    # The info is shared by all callers, so it can't be changed.
+    with pytest.raises(TypeError):
+        jira_info["test1"] = None
 
 
 @pytest.mark.parametrize(
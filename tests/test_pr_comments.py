@@ -60,8 +60,13 @@ COMMENT_DATA = {
     "lists": [1, 2, 3, [4, 5, 6]],
 }
 
+DIGIT_RE = re.compile(r"\d")
+
+# A comment with COMMENT_DATA in it, for tests to read.
+COMMENT_WITH_DATA = f"blah blah{format_data_for_comment(COMMENT_DATA)}"
+
 def test_data_in_comments():
-    comment = "blah blah" + format_data_for_comment(COMMENT_DATA)
+    comment = COMMENT_WITH_DATA
     check_good_markdown(comment)
     data = extract_data_from_comment(comment)
     assert data == COMMENT_DATA
@@ -74,7 +79,6 @@ def test_no_data_in_comments():
 
 def test_corrupted_data_in_comments():
     # If the data island is tampered with, don't let that break the bot.
-    comment = "blah blah" + format_data_for_comment(COMMENT_DATA)
-    comment = re.sub(r"\d", "xyz", comment)
+    comment = DIGIT_RE.sub("xyz", COMMENT_WITH_DATA)
     data = extract_data_from_comment(comment)
     assert data == {}
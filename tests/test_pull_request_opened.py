@@ -1,7 +1,6 @@
 """Tests of tasks/github.py:pull_request_changed for opening pull requests."""
 
 import textwrap
-from unittest import mock
 
 import pytest
 
@@ -80,11 +79,11 @@ def test_pr_in_nocontrib_repo_opened(fake_github, user):
     ("user:feanil", "@feanil"),
     ("feanil", "@feanil"),
 ])
-@mock.patch("openedx_webhooks.bot_comments.get_catalog_info")
-def test_pr_with_owner_repo_opened(get_catalog_info, fake_github, owner, tag):
-    get_catalog_info.return_value = {
-        'spec': {'owner': owner, 'lifecycle': 'production'}
-    }
+def test_pr_with_owner_repo_opened(mocker, fake_github, owner, tag):
+    mocker.patch(
+        "openedx_webhooks.bot_comments.get_catalog_info",
+        return_value={'spec': {'owner': owner, 'lifecycle': 'production'}},
+    )
     pr = fake_github.make_pull_request(owner="openedx", repo="edx-platform")
     result = pull_request_changed(pr.as_json())
     assert not result.jira_issues
@@ -94,11 +93,11 @@ def test_pr_with_owner_repo_opened(get_catalog_info, fake_github, owner, tag):
     assert f"This repository is currently maintained by `{tag}`" in body
 
 @pytest.mark.parametrize("lifecycle", ["production", "deprecated", None])
-@mock.patch("openedx_webhooks.bot_comments.get_catalog_info")
-def test_pr_without_owner_repo_opened(get_catalog_info, fake_github, lifecycle):
-    get_catalog_info.return_value = {
-        'spec': {'lifecycle': lifecycle}
-    } if lifecycle else None
+def test_pr_without_owner_repo_opened(mocker, fake_github, lifecycle):
+    mocker.patch(
+        "openedx_webhooks.bot_comments.get_catalog_info",
+        return_value={'spec': {'lifecycle': lifecycle}} if lifecycle else None,
+    )
     pr = fake_github.make_pull_request(owner="openedx", repo="edx-platform")
     result = pull_request_changed(pr.as_json())
     assert not result.jira_issues